@@ -1,41 +1,575 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
+import io
 import ipaddress
+import itertools
 import os
+import queue
+import tarfile
 import zipfile
 import re
-import subprocess
-import platform
-from netmiko import ConnectHandler, NetmikoTimeoutException, NetmikoAuthenticationException
+import socket
+import sys
+import threading
+import time
+import warnings
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
-def is_reachable(host, count=1, timeout=1):
-    """Ping a host to check reachability in a cross-platform way."""
-    system = platform.system().lower()
-    if system == 'windows':
-        # Windows ping uses milliseconds for timeout
-        cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000), host]
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+ARCHIVE_FORMATS = ('zip', 'tar.zst', 'tar')
+
+
+def _default_max_workers():
+    """Size the backup pool from the CPU count, capped by the open-file limit."""
+    workers = max(16, (os.cpu_count() or 4) * 4)
+    if resource is not None:
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != resource.RLIM_INFINITY:
+            # Leave room for probe sockets, pooled sessions and the archive
+            workers = min(workers, soft // 4)
+    return max(1, workers)
+
+
+DEFAULT_MAX_WORKERS = _default_max_workers()
+
+# Compiled once rather than per device
+HOSTNAME_RE = re.compile(r'^hostname\s+(\S+)', re.MULTILINE)
+UNSAFE_NAME_RE = re.compile(r'[^\w.-]')
+
+
+_print_lock = threading.Lock()
+
+
+def _report(message):
+    """Print a progress line without interleaving with other threads."""
+    # print() writes the text and the newline separately, so concurrent
+    # calls can splice lines together unless they are serialized
+    with _print_lock:
+        print(message)
+
+
+def is_reachable(host, count=1, timeout=1, *, port=22):
+    """Check reachability by opening a TCP connection to the SSH port.
+
+    ``count`` is left over from the ping-based check and is ignored.
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _default_port(device_type):
+    """Return the port Netmiko would use for a device type, or None for serial."""
+    if device_type.endswith('_serial'):
+        return None
+    return 23 if device_type.endswith('_telnet') else 22
+
+
+def generate_ips(network):
+    """Return a lazy iterator over the usable host addresses of a network.
+
+    The network is parsed eagerly so invalid input fails immediately, but
+    addresses are produced on demand; a /16 never sits in memory at once.
+    """
+    net = ipaddress.ip_network(network, strict=False)
+    if net.version != 4:
+        return (str(ip) for ip in net.hosts())
+
+    # Format IPv4 addresses straight from integers rather than building an
+    # IPv4Address object per host; /31 and /32 have no network/broadcast
+    base = int(net.network_address)
+    if net.prefixlen < 31:
+        start, end = base + 1, base + net.num_addresses - 1
     else:
-        cmd = ["ping", "-c", str(count), "-W", str(timeout), host]
+        start, end = base, base + net.num_addresses
+    return (f"{i >> 24}.{(i >> 16) & 0xff}.{(i >> 8) & 0xff}.{i & 0xff}"
+            for i in range(start, end))
 
+
+def _close_quietly(connection):
+    """Disconnect a Netmiko session, ignoring errors from dead transports."""
     try:
-        subprocess.run(
-            cmd,
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
+        connection.disconnect()
+    except Exception:
+        pass
+
+
+def _open_socket(host, port, timeout):
+    """Open a TCP connection for an SSH session, tuned for interactive use.
+
+    Handing Netmiko a ready socket lets Nagle be disabled before the SSH
+    handshake rather than after it, and skips Paramiko's own name lookup.
+    """
+    sock = socket.create_connection((host, port), timeout=timeout)
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Keepalive timings are only tunable per-socket on some platforms
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class RateLimiter:
+    """Space out events to at most ``rate`` per second across threads."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def acquire(self):
+        """Block until the caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + 1 / self.rate
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ConnectionPool:
+    """Thread-safe cache of authenticated Netmiko sessions.
+
+    Sessions are keyed by ``(host, username, device_type, port)`` so repeated
+    calls against the same device skip the SSH handshake and Netmiko's session
+    preparation. Idle sessions are reaped after ``idle_timeout`` seconds and
+    never reused once older than ``max_age`` seconds. New connections are
+    paced by ``limiter``, if given, so bursts of workers do not trip sshd's
+    MaxStartups throttling; reused sessions are not.
+    """
+
+    def __init__(self, max_size=64, idle_timeout=60, max_age=300, limiter=None):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self.limiter = limiter
+        self._lock = threading.RLock()
+        self._pool = {}
+        self._created = {}
+        self._size = 0
+        self._reaper = None
+        self._closed = False
+
+    @contextmanager
+    def acquire(self, key, conn_params):
+        """Yield a live session for ``key``, opening one from ``conn_params`` if needed."""
+        connection = self._checkout(key)
+        if connection is None:
+            connection = self._connect(conn_params)
+            with self._lock:
+                self._created[connection] = time.monotonic()
+        try:
+            yield connection
+        except Exception:
+            self._discard(connection)
+            raise
+        self.release(key, connection)
+
+    def release(self, key, connection):
+        """Return a session to the pool, closing it if it cannot be kept."""
+        now = time.monotonic()
+        with self._lock:
+            created = self._created.get(connection, now)
+            keep = (not self._closed and self._size < self.max_size
+                    and now - created < self.max_age)
+            if keep:
+                self._pool.setdefault(key, []).append((connection, created, now))
+                self._size += 1
+                self._schedule_reaper()
+        if not keep:
+            self._discard(connection)
+
+    def close(self):
+        """Disconnect every idle session and stop the reaper."""
+        with self._lock:
+            self._closed = True
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+            idle = [entry[0] for entries in self._pool.values() for entry in entries]
+            self._pool.clear()
+            self._size = 0
+        for connection in idle:
+            self._discard(connection)
+
+    def _connect(self, conn_params):
+        from netmiko import ConnectHandler, NetmikoTimeoutException
+
+        if self.limiter is not None:
+            self.limiter.acquire()
+        device_type = conn_params.get('device_type', '')
+        # Netmiko only accepts a ready socket for SSH sessions
+        if device_type.endswith(('_telnet', '_serial')):
+            return ConnectHandler(**conn_params)
+        host, port = conn_params['host'], conn_params.get('port', 22)
+        try:
+            sock = _open_socket(host, port, conn_params.get('conn_timeout', 10))
+        except OSError as error:
+            # Report socket failures the way Netmiko does when it opens the
+            # connection itself, so callers treat them as a failed device
+            raise NetmikoTimeoutException(
+                f"TCP connection to {host}:{port} failed: {error}") from error
+        try:
+            return ConnectHandler(sock=sock, **conn_params)
+        except Exception:
+            sock.close()
+            raise
+
+    def _checkout(self, key):
+        while True:
+            with self._lock:
+                entries = self._pool.get(key)
+                if not entries:
+                    return None
+                connection, created, _ = entries.pop()
+                self._size -= 1
+            if time.monotonic() - created < self.max_age and connection.is_alive():
+                return connection
+            self._discard(connection)
+
+    def _discard(self, connection):
+        with self._lock:
+            self._created.pop(connection, None)
+        _close_quietly(connection)
+
+    def _schedule_reaper(self):
+        # Caller holds the lock
+        if self._reaper is None and not self._closed:
+            self._reaper = threading.Timer(self.idle_timeout, self._reap)
+            self._reaper.daemon = True
+            self._reaper.start()
+
+    def _reap(self):
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            self._reaper = None
+            for key, entries in list(self._pool.items()):
+                live = []
+                for entry in entries:
+                    connection, created, last_used = entry
+                    if now - last_used > self.idle_timeout or now - created > self.max_age:
+                        expired.append(connection)
+                    else:
+                        live.append(entry)
+                if live:
+                    self._pool[key] = live
+                else:
+                    del self._pool[key]
+            self._size -= len(expired)
+            if self._pool:
+                self._schedule_reaper()
+        for connection in expired:
+            self._discard(connection)
+
+
+def _deflate(data, level):
+    """Return the CRC, size and raw deflate stream of a bytes payload."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return zlib.crc32(data), len(data), compressed
+
+
+def _write_deflated(zipf, zinfo, crc, size, compressed):
+    """Append an already-deflated member to an open ZipFile.
+
+    This follows ZipFile.writestr minus the compression step, which lets
+    callers deflate members on other threads before handing them over.
+    """
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = len(compressed)
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
+    zinfo.header_offset = zipf.fp.tell()
+    zipf.fp.write(zinfo.FileHeader())
+    zipf.fp.write(compressed)
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf.start_dir = zipf.fp.tell()
+
+
+class ArchiveWriter:
+    """Stream configs into an archive from a single writer thread.
+
+    Workers call add() with the config bytes they just fetched, so nothing
+    is written to disk and read back. Zip members are deflated by the
+    calling worker, which spreads compression across the worker pool;
+    the writer thread only appends finished entries to the archive.
+    """
+
+    def __init__(self, archive_path, archive_format='zip', zip_level=1):
+        if archive_format == 'tar.zst' and zstandard is None:
+            raise RuntimeError("tar.zst archives require the 'zstandard' package")
+        self.archive_path = archive_path
+        self.archive_format = archive_format
+        self.zip_level = zip_level
+        self._queue = queue.Queue()
+        self._names = set()
+        self._lock = threading.Lock()
+        self._error = None
+        # Stamp every member with the run's start time, computed once
+        self._mtime = time.time()
+        # Open the file up front so a bad path fails before any device is
+        # contacted; zipfile emits many small header writes and a 1 MiB
+        # buffer batches them
+        self._raw = open(archive_path, 'wb', buffering=1 << 20)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, name, data, host=None):
+        """Queue encoded config bytes and return the archive member name used.
+
+        A name already in the archive gets ``host`` appended, so devices
+        sharing a hostname keep a stable, identifiable member name rather
+        than a counter that depends on which finished first.
+        """
+        with self._lock:
+            stem, ext = os.path.splitext(name)
+            if name in self._names and host is not None:
+                name = f"{stem}_{UNSAFE_NAME_RE.sub('_', host)}{ext}"
+            # Only reachable for callers without a host, or for repeats of one
+            suffix = 1
+            base = os.path.splitext(name)[0]
+            while name in self._names:
+                suffix += 1
+                name = f"{base}-{suffix}{ext}"
+            self._names.add(name)
+        if self.archive_format == 'zip' and self.zip_level > 0:
+            self._queue.put((name, _deflate(data, self.zip_level)))
+        else:
+            self._queue.put((name, data))
+        return name
+
+    def close(self):
+        """Flush queued entries, finish the archive and re-raise writer errors."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _items(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            yield item
+
+    def _run(self):
+        try:
+            if self.archive_format == 'zip':
+                self._write_zip()
+            else:
+                self._write_tar()
+        except Exception as error:
+            self._error = error
+            # Drain so close() still returns once workers are done
+            for _ in self._items():
+                pass
+        finally:
+            self._raw.close()
+
+    def _write_zip(self):
+        with zipfile.ZipFile(self._raw, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            date_time = time.localtime(self._mtime)[:6]
+            for name, payload in self._items():
+                zinfo = zipfile.ZipInfo(name, date_time=date_time)
+                zinfo.external_attr = 0o644 << 16
+                if self.zip_level > 0:
+                    _write_deflated(zipf, zinfo, *payload)
+                else:
+                    # Level 0 stores members as-is rather than wrapping them
+                    # in uncompressed deflate blocks
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                    zipf.writestr(zinfo, payload)
+
+    def _write_tar(self):
+        if self.archive_format == 'tar.zst':
+            # Multi-threaded zstd keeps every core busy, unlike single-stream deflate
+            cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+            with cctx.stream_writer(self._raw, closefd=False) as zst:
+                self._fill_tar(zst)
+        else:
+            # Plain tar skips compression for callers that compress later
+            self._fill_tar(self._raw)
+
+    def _fill_tar(self, fileobj):
+        with tarfile.open(fileobj=fileobj, mode='w|') as tar:
+            for name, data in self._items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = self._mtime
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(data))
+
+
+def config_name(config, prompt, host):
+    """Pick a file-safe base name for a device's config.
+
+    Prefers the hostname line in the output, then the prompt (dropping any
+    "user@" prefix), then the IP; any of these may hold characters (e.g.
+    IPv6 colons) that are invalid in file names. Only a str is returned, so
+    no regex match keeps the config text alive in the caller.
+    """
+    # The substring test skips the regex for output without the directive
+    match = HOSTNAME_RE.search(config) if 'hostname' in config else None
+    if match:
+        hostname = match.group(1)
+    else:
+        hostname = (prompt or '').rpartition('@')[2] or host
+    return UNSAFE_NAME_RE.sub('_', hostname)
+
+
+def backup_device(host, username, password, device_type, output_dir, command,
+                  pool, archive, port=None, keep_loose=False, delay_factor=0.1,
+                  read_timeout=60):
+    """Back up a single device, returning True if its config was saved.
+
+    ``port`` defaults to 23 for ``*_telnet`` device types and 22 otherwise.
+    """
+    # Netmiko drags in Paramiko and cryptography; importing it on first use
+    # keeps --help and argument errors instant
+    from netmiko import NetmikoAuthenticationException, NetmikoTimeoutException, ReadTimeout
+
+    if port is None:
+        port = _default_port(device_type)
+    device_params = {
+        'device_type': device_type,
+        'host': host,
+        'username': username,
+        'password': password,
+        # SSH-level keepalive so pooled sessions survive idle NAT/firewall timers
+        'keepalive': 30,
+        # Netmiko paces session setup with sleeps scaled by the delay factor;
+        # fast_cli lets a factor below 1 shorten them
+        'fast_cli': True,
+        'global_delay_factor': delay_factor,
+    }
+    if port is not None:
+        device_params['port'] = port
+    key = (host, username, device_type, port)
+    try:
+        _report(f"Connecting to {host}...")
+        with pool.acquire(key, device_params) as connection:
+            cmd = command if command else 'show running-config'
+            _report(f"Running command on {host}: {cmd}")
+            config = connection.send_command(cmd, read_timeout=read_timeout)
+            # Netmiko learned the prompt during session setup, so it names
+            # devices whose output has no hostname line without another command
+            prompt = connection.base_prompt
+
+        filename_base = config_name(config, prompt, host)
+
+        # Encode once and share the bytes with the archive and the optional
+        # loose copy; dropping the str means a multi-megabyte config is not
+        # held twice while it is compressed and written
+        data = config.encode('utf-8')
+        del config
+        name = archive.add(f"{filename_base}.cfg", data, host)
+        _report(f"Config archived: {name} ({host})")
+
+        if keep_loose:
+            filename = os.path.join(output_dir, name)
+            # One write through a large binary buffer, no text-layer chunking
+            with open(filename, 'wb', buffering=1 << 20) as file:
+                file.write(data)
+            _report(f"Config saved: {filename}")
         return True
-    except subprocess.CalledProcessError:
+
+    except (NetmikoTimeoutException, NetmikoAuthenticationException, ReadTimeout) as error:
+        _report(f"Failed for {host}: {error}")
         return False
 
 
+def _bounded_map(executor, fn, items, limit):
+    """Yield ``(item, fn(item))`` pairs in completion order.
+
+    Unlike submitting everything up front, at most ``limit`` calls are
+    outstanding at once, so memory stays proportional to the worker count
+    rather than the number of hosts in the subnet.
+    """
+    items = iter(items)
+    pending = {executor.submit(fn, item): item for item in itertools.islice(items, limit)}
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in itertools.islice(items, 1):
+                    pending[executor.submit(fn, next_item)] = next_item
+                yield item, future.result()
+    finally:
+        # On Ctrl-C, a failing call or an abandoned generator, drop the
+        # queued calls so the executor's shutdown does not run them anyway
+        for future in pending:
+            future.cancel()
+
+
+def sweep(hosts, port=22, timeout=1, max_workers=128):
+    """Probe many hosts at once, yielding ``(host, reachable)`` as they finish.
+
+    Probes are cheap and mostly spent waiting, so they run on their own,
+    wider pool; the sweep then takes as long as the slowest probe rather
+    than the sum of all of them.
+    """
+    probe = functools.partial(is_reachable, port=port, timeout=timeout)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from _bounded_map(executor, probe, hosts, max_workers * 2)
+
+
 def backup_configs(network, username, password, device_type, output_dir,
-                   zip_name, command, ping_count=1, ping_timeout=1):
-    # Parse network and get all hosts in the subnet
-    net = ipaddress.ip_network(network, strict=False)
-    hosts = list(net.hosts())
+                   zip_name, command, ping_count=None, ping_timeout=None, *,
+                   port=None, probe_timeout=1, max_workers=DEFAULT_MAX_WORKERS,
+                   archive_format='zip', keep_loose=False, delay_factor=0.1,
+                   read_timeout=60, probe_workers=128, pool_size=0, pool_idle=60,
+                   pool_max_age=300, connect_rate=8, zip_level=1, pool=None):
+    """Back up every reachable device in ``network`` into one archive.
+
+    ``port`` defaults to 23 for ``*_telnet`` device types and 22 otherwise;
+    ``*_serial`` device types have no port and are not probed.
+
+    Pass a ``ConnectionPool`` as ``pool`` to reuse its sessions across runs
+    (for example a scheduler backing up the same subnet repeatedly); the
+    caller then owns it and must close it. Otherwise a private pool built
+    from ``pool_size``, ``pool_idle``, ``pool_max_age`` and ``connect_rate``
+    is used and closed when the run ends.
+    """
+    # ping_count/ping_timeout predate the TCP probe and keep their original
+    # positional slots for existing callers
+    if ping_timeout is not None:
+        warnings.warn("ping_timeout is deprecated; use probe_timeout",
+                      DeprecationWarning, stacklevel=2)
+        probe_timeout = ping_timeout
+    if ping_count is not None:
+        warnings.warn("ping_count is deprecated and ignored by the TCP probe",
+                      DeprecationWarning, stacklevel=2)
+    if port is None:
+        port = _default_port(device_type)
+
+    # Get all hosts in the subnet
+    hosts = generate_ips(network)
 
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
@@ -43,50 +577,63 @@ def backup_configs(network, username, password, device_type, output_dir,
     successes = []
     failures = []
 
-    for ip in hosts:
-        host = str(ip)
-        # Skip if host is unreachable
-        if not is_reachable(host, count=ping_count, timeout=ping_timeout):
-            print(f"{host} is unreachable, skipping.")
-            failures.append(host)
-            continue
-
-        device_params = {
-            'device_type': device_type,
-            'host': host,
-            'username': username,
-            'password': password,
-        }
+    def reachable_hosts():
+        # Feeds the backup stage lazily, so devices are backed up while the
+        # rest of the subnet is still being probed
+        if port is None:
+            # Serial consoles have no TCP port to probe
+            yield from hosts
+            return
+        for host, reachable in sweep(hosts, port, probe_timeout, probe_workers):
+            if reachable:
+                yield host
+            else:
+                _report(f"{host} is unreachable, skipping.")
+                failures.append(host)
+
+    # Created first so an unwritable archive path fails before any SSH work
+    archive_path = os.path.join(output_dir, zip_name)
+    archive = ArchiveWriter(archive_path, archive_format, zip_level)
+
+    # Netmiko is blocking, so devices are processed on a bounded thread pool.
+    # A run visits each device once, so a private pool keeps nothing by
+    # default (pool_size=0) and sessions are closed straight after use
+    # rather than holding VTY lines open.
+    owns_pool = pool is None
+    if owns_pool:
+        limiter = RateLimiter(connect_rate) if connect_rate > 0 else None
+        pool = ConnectionPool(max_size=pool_size, idle_timeout=pool_idle,
+                              max_age=pool_max_age, limiter=limiter)
+    try:
+        task = functools.partial(
+            backup_device, username=username, password=password,
+            device_type=device_type, output_dir=output_dir, command=command,
+            pool=pool, archive=archive, port=port, keep_loose=keep_loose,
+            delay_factor=delay_factor, read_timeout=read_timeout
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for host, saved in _bounded_map(executor, task, reachable_hosts(), max_workers * 2):
+                if saved:
+                    successes.append(host)
+                else:
+                    failures.append(host)
+    finally:
+        if owns_pool:
+            pool.close()
+        # Hold a writer error until the summary has been printed
+        archive_error = None
         try:
-            print(f"Connecting to {host}...")
-            connection = ConnectHandler(**device_params)
-            cmd = command if command else 'show running-config'
-            print(f"Running command: {cmd}")
-            config = connection.send_command(cmd)
-
-            # Extract hostname from running-config, fallback to IP
-            match = re.search(r'^hostname\s+(\S+)', config, re.MULTILINE)
-            filename_base = match.group(1) if match else host
-
-            # Save running config to file named after hostname
-            filename = os.path.join(output_dir, f"{filename_base}.cfg")
-            with open(filename, 'w') as file:
-                file.write(config)
-            print(f"Config saved: {filename}")
-            connection.disconnect()
-            successes.append(host)
-
-        except (NetmikoTimeoutException, NetmikoAuthenticationException) as error:
-            print(f"Failed for {host}: {error}")
-            failures.append(host)
-
-    # Create zip archive of all .cfg files
-    zip_path = os.path.join(output_dir, zip_name)
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for cfg_file in os.listdir(output_dir):
-            if cfg_file.endswith('.cfg'):
-                zipf.write(os.path.join(output_dir, cfg_file), cfg_file)
-    print(f"All configs zipped into {zip_path}")
+            archive.close()
+        except Exception as error:
+            archive_error = error
+    if archive_error is None:
+        print(f"All configs archived into {archive_path}")
+    else:
+        print(f"Failed to write archive {archive_path}: {archive_error}")
+
+    # Results arrive in completion order; restore address order for the summary
+    successes.sort(key=ipaddress.ip_address)
+    failures.sort(key=ipaddress.ip_address)
 
     # Print summary of results
     print("\nSummary:")
@@ -97,6 +644,9 @@ def backup_configs(network, username, password, device_type, output_dir,
     if failures:
         print("    " + ", ".join(failures))
 
+    if archive_error is not None:
+        raise archive_error
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
@@ -114,15 +664,124 @@ if __name__ == '__main__':
         help='SSH password (or set SSH_PASSWORD env var)'
     )
     parser.add_argument('-d', '--device-type', default='cisco_ios', help='Netmiko device type (default: cisco_ios)')
-    parser.add_argument('-o', '--output', default='configs', help='Directory to save configs (default: configs)')
-    parser.add_argument('-z', '--zip-name', default='configs.zip', help='Name of the zip file (default: configs.zip)')
+    parser.add_argument('-o', '--output', default='configs', help='Directory to save the archive in (default: configs)')
+    parser.add_argument(
+        '-z', '--zip-name', '--archive-name',
+        dest='zip_name',
+        help='Name of the archive file (default: configs.<format>)'
+    )
+    parser.add_argument(
+        '-f', '--format',
+        choices=ARCHIVE_FORMATS,
+        default='zip',
+        help="Archive format; 'tar.zst' needs the zstandard package and 'tar' "
+             "stores configs uncompressed (default: zip)"
+    )
+    parser.add_argument(
+        '--zip-level',
+        type=int,
+        choices=range(10),
+        metavar='{0-9}',
+        help='Deflate level for zip archives; 0 stores configs uncompressed, '
+             'higher is smaller but slower (default: 1)'
+    )
+    parser.add_argument(
+        '--no-compress',
+        action='store_true',
+        help='Store configs uncompressed (zip level 0, or plain tar instead of tar.zst)'
+    )
+    parser.add_argument(
+        '--keep-loose',
+        action='store_true',
+        help='Also save each config as a .cfg file in the output directory'
+    )
     parser.add_argument('-c', '--command', help="CLI command to run (default: 'show running-config')")
-    parser.add_argument('--ping-count', type=int, default=1, help='Number of ping attempts (default: 1)')
-    parser.add_argument('--ping-timeout', type=int, default=1, help='Ping timeout in seconds (default: 1)')
+    parser.add_argument(
+        '--port',
+        type=int,
+        help='Port to probe and connect to (default: 23 for *_telnet device types, 22 otherwise)'
+    )
+    parser.add_argument(
+        '--probe-timeout', '--ping-timeout',
+        dest='probe_timeout',
+        type=float,
+        default=1,
+        help='Reachability probe timeout in seconds (default: 1)'
+    )
+    parser.add_argument(
+        '--ping-count',
+        type=int,
+        help='Deprecated and ignored; reachability is a single TCP probe'
+    )
+    parser.add_argument(
+        '--delay-factor',
+        type=float,
+        default=0.1,
+        help='Netmiko global delay factor; raise for slow devices (default: 0.1)'
+    )
+    parser.add_argument(
+        '--read-timeout',
+        type=float,
+        default=60,
+        help='Seconds to wait for command output (default: 60)'
+    )
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help='Number of devices processed concurrently (default: %(default)s, '
+             'from CPU count and open-file limit)'
+    )
+    parser.add_argument(
+        '--probe-workers',
+        type=int,
+        default=128,
+        help='Number of reachability probes run concurrently (default: 128)'
+    )
+    parser.add_argument(
+        '--connect-rate',
+        type=float,
+        default=8,
+        help='Maximum new SSH connections per second, 0 for unlimited (default: 8)'
+    )
     args = parser.parse_args()
 
+    if args.ping_count is not None:
+        print('warning: --ping-count is deprecated and ignored', file=sys.stderr)
     if not args.username or not args.password:
         parser.error('SSH username and password required via options or environment variables')
+    if args.max_workers < 1:
+        parser.error('--max-workers must be at least 1')
+    if args.probe_workers < 1:
+        parser.error('--probe-workers must be at least 1')
+    if args.probe_timeout <= 0:
+        parser.error('--probe-timeout must be greater than 0')
+    if args.read_timeout <= 0:
+        parser.error('--read-timeout must be greater than 0')
+    if args.delay_factor <= 0:
+        parser.error('--delay-factor must be greater than 0')
+    if args.connect_rate < 0:
+        parser.error('--connect-rate cannot be negative')
+    if args.zip_level is not None and args.format != 'zip':
+        parser.error(f"--zip-level only applies to zip archives, not --format {args.format}")
+    if args.no_compress:
+        if args.zip_level:
+            parser.error('--no-compress cannot be combined with a non-zero --zip-level')
+        args.zip_level = 0
+        if args.format == 'tar.zst':
+            args.format = 'tar'
+    if args.zip_level is None:
+        args.zip_level = 1
+    if args.format == 'tar.zst' and zstandard is None:
+        parser.error("--format tar.zst requires the 'zstandard' package (pip install zstandard)")
+    if not args.zip_name:
+        args.zip_name = f"configs.{args.format}"
+    else:
+        # Catch e.g. "-z backup.tar.zst" when --no-compress writes a plain tar
+        suffix = next((f for f in ARCHIVE_FORMATS if args.zip_name.endswith(f".{f}")), None)
+        if suffix is not None and suffix != args.format:
+            parser.error(f"archive name '{args.zip_name}' does not match the "
+                         f"effective format '{args.format}'")
 
     backup_configs(
         args.network,
@@ -132,6 +791,14 @@ if __name__ == '__main__':
         args.output,
         args.zip_name,
         args.command,
-        ping_count=args.ping_count,
-        ping_timeout=args.ping_timeout
+        port=args.port,
+        probe_timeout=args.probe_timeout,
+        max_workers=args.max_workers,
+        archive_format=args.format,
+        keep_loose=args.keep_loose,
+        delay_factor=args.delay_factor,
+        read_timeout=args.read_timeout,
+        probe_workers=args.probe_workers,
+        connect_rate=args.connect_rate,
+        zip_level=args.zip_level
     )
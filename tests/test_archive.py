@@ -0,0 +1,70 @@
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hosthoover  # noqa: E402
+
+CONFIGS = [
+    ('core-sw1.cfg', b'hostname core-sw1\n!\ninterface Vlan1\n' * 200, '10.0.0.1'),
+    ('zürich-rtr.cfg', 'hostname zürich-rtr\n'.encode('utf-8'), '10.0.0.2'),
+    ('core-sw1.cfg', b'hostname core-sw1\n! second chassis\n', '10.0.0.3'),
+    ('empty.cfg', b'', '10.0.0.4'),
+]
+
+EXPECTED_NAMES = ['core-sw1.cfg', 'zürich-rtr.cfg', 'core-sw1_10.0.0.3.cfg', 'empty.cfg']
+
+
+class ArchiveRoundTripTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, archive_format, zip_level=1):
+        path = os.path.join(self.tmp.name, f"configs.{archive_format}")
+        archive = hosthoover.ArchiveWriter(path, archive_format, zip_level)
+        names = [archive.add(name, data, host) for name, data, host in CONFIGS]
+        archive.close()
+        self.assertEqual(names, EXPECTED_NAMES)
+        return path
+
+    def expected(self):
+        return {name: data for name, (_, data, _) in zip(EXPECTED_NAMES, CONFIGS)}
+
+    def test_zip_levels(self):
+        for level in (0, 1, 9):
+            with self.subTest(level=level):
+                path = self.write('zip', level)
+                with zipfile.ZipFile(path) as zipf:
+                    self.assertIsNone(zipf.testzip())
+                    self.assertEqual({info.filename: zipf.read(info) for info in zipf.infolist()},
+                                     self.expected())
+                    stored = {info.compress_type == zipfile.ZIP_STORED for info in zipf.infolist()}
+                    self.assertEqual(stored, {level == 0})
+
+    def test_tar(self):
+        path = self.write('tar')
+        with tarfile.open(path) as tar:
+            self.assertEqual(self.read_tar(tar), self.expected())
+
+    @unittest.skipIf(hosthoover.zstandard is None, 'zstandard is not installed')
+    def test_tar_zst(self):
+        path = self.write('tar.zst')
+        with open(path, 'rb') as raw:
+            data = hosthoover.zstandard.ZstdDecompressor().stream_reader(raw).read()
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            self.assertEqual(self.read_tar(tar), self.expected())
+
+    @staticmethod
+    def read_tar(tar):
+        return {member.name: tar.extractfile(member).read() for member in tar.getmembers()}
+
+
+if __name__ == '__main__':
+    unittest.main()